@@ -17,17 +17,8 @@ BanMan::BanMan(fs::path ban_file, CClientUIInterface* client_interface, int64_t
 {
     if (m_client_interface) m_client_interface->InitMessage(_("Loading banlist...").translated);
 
-    int64_t n_start = GetTimeMillis();
     m_is_dirty = false;
-    banmap_t banmap;
-    if (m_ban_db.Read(banmap)) {
-        SetBanned(banmap);        // thread save setter
-        SetBannedSetDirty(false); // no need to write down, just read data
-        SweepBanned();            // sweep out unused entries
-
-        LogPrint(BCLog::NET, "Loaded %d banned node ips/subnets from banlist.dat  %dms\n",
-            m_banned.size(), GetTimeMillis() - n_start);
-    } else {
+    if (!LoadBanlist()) {
         LogPrintf("Recreating banlist.dat\n");
         SetBannedSetDirty(true); // force write
         DumpBanlist();
@@ -57,10 +48,45 @@ void BanMan::DumpBanlist()
         banmap.size(), GetTimeMillis() - n_start);
 }
 
+bool BanMan::LoadBanlist()
+{
+    int64_t n_start = GetTimeMillis();
+    banmap_t banmap;
+    if (!m_ban_db.Read(banmap)) return false;
+
+    SetBanned(banmap);        // thread save setter
+    SetBannedSetDirty(false); // no need to write down, just read data
+    SweepBanned();            // sweep out unused entries
+
+    LogPrint(BCLog::NET, "Loaded %d banned node ips/subnets from banlist.dat  %dms\n",
+        WITH_LOCK(m_cs_banned, return m_banned.size()), GetTimeMillis() - n_start);
+    return true;
+}
+
+bool BanMan::ReloadBanlist()
+{
+    {
+        // hold the lock across the write and the read, so no ban added in between is lost.
+        // Only the file I/O runs under it: expired entries are swept by the next
+        // GetBanned() or DumpBanlist(), and the UI is notified once the lock is released.
+        LOCK(m_cs_banned);
+        // don't replace the in-memory banlist with stale file contents if the write failed
+        if (!m_ban_db.Write(m_banned)) return false;
+        banmap_t banmap;
+        if (!m_ban_db.Read(banmap)) return false;
+        m_banned.swap(banmap);
+        m_is_dirty = false;
+        LogPrint(BCLog::NET, "Reloaded %d banned node ips/subnets from banlist.dat\n", m_banned.size());
+    }
+    if (m_client_interface) m_client_interface->BannedListChanged();
+    return true;
+}
+
 void BanMan::ClearBanned()
 {
     {
         LOCK(m_cs_banned);
+        if (m_banned.empty()) return; // nothing to clear, skip rewriting banlist.dat
         m_banned.clear();
         m_is_dirty = true;
     }
@@ -77,8 +77,13 @@ public:
     bool Unban(const CSubNet& sub_net);
     void GetBanned(banmap_t& banmap);
     void DumpBanlist();
+    //! Write the banlist to disk and replace the in-memory banlist with what is read back (used by tests).
+    //! Returns false, leaving the in-memory banlist untouched, if the write or the read fails.
+    bool ReloadBanlist();
 
 private:
+    //! Read the banlist from disk, replacing the in-memory banlist
+    bool LoadBanlist();
     void SetBanned(const banmap_t& banmap);
     bool BannedSetIsDirty();
     //!set the "dirty" flag for the banlist
@@ -1185,6 +1185,7 @@ bool CConnman::AddConnection(const std::string& address, ConnectionType conn_typ
 
 void CConnman::DisconnectNodes()
 {
+    bool removed_nodes = false;
     {
         LOCK(cs_vNodes);
 
@@ -1216,9 +1217,15 @@ void CConnman::DisconnectNodes()
                 // hold in disconnected pool until all refs are released
                 pnode->Release();
                 vNodesDisconnected.push_back(pnode);
+                removed_nodes = true;
             }
         }
     }
+    if (removed_nodes) {
+        // wake up any thread waiting in WaitForPendingDisconnects() or WaitForDisconnect()
+        LOCK(m_disconnect_mutex);
+        m_disconnect_cv.notify_all();
+    }
     {
         // Delete disconnected nodes
         std::list<CNode*> vNodesDisconnectedCopy = vNodesDisconnected;
@@ -2776,12 +2783,13 @@ void CConnman::GetNodeStats(std::vector<CNodeStats>& vstats) const
     }
 }
 
-bool CConnman::DisconnectNode(const std::string& strNode)
+bool CConnman::DisconnectNode(const std::string& strNode, NodeId* disconnected_id)
 {
     LOCK(cs_vNodes);
     if (CNode* pnode = FindNode(strNode)) {
         LogPrint(BCLog::NET, "disconnect by address%s matched peer=%d; disconnecting\n", (fLogIPs ? strprintf("=%s", strNode) : ""), pnode->GetId());
         pnode->fDisconnect = true;
+        if (disconnected_id) *disconnected_id = pnode->GetId();
         return true;
     }
     return false;
@@ -2819,6 +2827,26 @@ bool CConnman::DisconnectNode(NodeId id)
     return false;
 }
 
+bool CConnman::WaitForPendingDisconnects(std::chrono::milliseconds timeout)
+{
+    const auto no_pending_disconnects = [this] {
+        LOCK(cs_vNodes);
+        return std::none_of(vNodes.begin(), vNodes.end(), [](const CNode* pnode) { return pnode->fDisconnect.load(); });
+    };
+    WAIT_LOCK(m_disconnect_mutex, lock);
+    return m_disconnect_cv.wait_for(lock, timeout, no_pending_disconnects);
+}
+
+bool CConnman::WaitForDisconnect(NodeId id, std::chrono::milliseconds timeout)
+{
+    const auto node_removed = [this, id] {
+        LOCK(cs_vNodes);
+        return std::none_of(vNodes.begin(), vNodes.end(), [id](const CNode* pnode) { return pnode->GetId() == id; });
+    };
+    WAIT_LOCK(m_disconnect_mutex, lock);
+    return m_disconnect_cv.wait_for(lock, timeout, node_removed);
+}
+
 void CConnman::RecordBytesRecv(uint64_t bytes)
 {
     LOCK(cs_totalBytesRecv);
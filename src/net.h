@@ -971,11 +971,34 @@ public:
 
     size_t GetNodeCount(ConnectionDirection) const;
     void GetNodeStats(std::vector<CNodeStats>& vstats) const;
-    bool DisconnectNode(const std::string& node);
+    //! Mark the node connected to the given address for disconnection. Its id is stored in
+    //! disconnected_id, if provided.
+    bool DisconnectNode(const std::string& node, NodeId* disconnected_id = nullptr);
     bool DisconnectNode(const CSubNet& subnet);
     bool DisconnectNode(const CNetAddr& addr);
     bool DisconnectNode(NodeId id);
 
+    /**
+     * Wait until every peer that is marked for disconnection has been removed
+     * from the list of connected nodes by the socket handler thread.
+     *
+     * @param[in]   timeout     Maximum time to wait
+     * @return      bool        Returns false if peers were still pending
+     *                          disconnection when the timeout expired
+     */
+    bool WaitForPendingDisconnects(std::chrono::milliseconds timeout);
+
+    /**
+     * Wait until the node with the given id has been removed from the list of
+     * connected nodes by the socket handler thread.
+     *
+     * @param[in]   id          Id of a node marked for disconnection
+     * @param[in]   timeout     Maximum time to wait
+     * @return      bool        Returns false if the node was still connected
+     *                          when the timeout expired
+     */
+    bool WaitForDisconnect(NodeId id, std::chrono::milliseconds timeout);
+
     //! Used to convey which local services we are offering peers during node
     //! connection.
     //!
@@ -1137,6 +1160,9 @@ private:
     std::vector<CNode*> vNodes GUARDED_BY(cs_vNodes);
     std::list<CNode*> vNodesDisconnected;
     mutable RecursiveMutex cs_vNodes;
+    /** Signaled whenever DisconnectNodes() removes peers from vNodes. */
+    std::condition_variable m_disconnect_cv;
+    Mutex m_disconnect_mutex;
     std::atomic<NodeId> nLastNodeId{0};
     unsigned int nPrevNodeCount{0};
 
@@ -0,0 +1 @@
+#define BUILD_GIT_COMMIT "8aeeff58751b-dirty"
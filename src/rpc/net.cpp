@@ -23,6 +23,7 @@
 #include <util/strencodings.h>
 #include <util/string.h>
 #include <util/system.h>
+#include <util/time.h>
 #include <util/translation.h>
 #include <validation.h>
 #include <version.h>
@@ -380,6 +381,45 @@ static RPCHelpMan addconnection()
     };
 }
 
+//! Upper bound for disconnectnode's wait option
+static constexpr std::chrono::seconds DISCONNECTNODE_WAIT_TIMEOUT{10};
+//! Longest single wait on a disconnect, so that RPC shutdown is noticed in time
+static constexpr std::chrono::milliseconds DISCONNECT_WAIT_SLICE{100};
+
+/**
+ * Wait until the node with the given id is gone, for up to DISCONNECTNODE_WAIT_TIMEOUT.
+ * Waits in short slices, so that an RPC shutdown is not held up.
+ * Unlike WaitUntilNoPendingDisconnects(), other peers being disconnected do not delay this.
+ */
+static bool WaitForNodeDisconnect(CConnman& connman, NodeId id)
+{
+    const auto deadline{std::chrono::steady_clock::now() + DISCONNECTNODE_WAIT_TIMEOUT};
+    while (true) {
+        const auto remaining{std::chrono::ceil<std::chrono::milliseconds>(deadline - std::chrono::steady_clock::now())};
+        if (connman.WaitForDisconnect(id, std::min(DISCONNECT_WAIT_SLICE, remaining))) return true;
+        if (!IsRPCRunning() || std::chrono::steady_clock::now() >= deadline) return false;
+    }
+}
+
+/**
+ * Wait until all peers marked for disconnection are gone, or the timeout (0 for none) expires.
+ * Waits in short slices, so that an RPC shutdown is not held up by a disconnect that never completes.
+ */
+static bool WaitUntilNoPendingDisconnects(CConnman& connman, std::chrono::milliseconds timeout)
+{
+    const auto deadline{std::chrono::steady_clock::now() + timeout};
+    while (true) {
+        auto slice{DISCONNECT_WAIT_SLICE};
+        if (timeout.count() > 0) {
+            // don't overshoot the deadline by waiting for a full slice
+            slice = std::min(slice, std::chrono::ceil<std::chrono::milliseconds>(deadline - std::chrono::steady_clock::now()));
+        }
+        if (connman.WaitForPendingDisconnects(slice)) return true;
+        if (!IsRPCRunning()) return false;
+        if (timeout.count() > 0 && std::chrono::steady_clock::now() >= deadline) return false;
+    }
+}
+
 static RPCHelpMan disconnectnode()
 {
     return RPCHelpMan{"disconnectnode",
@@ -389,6 +429,8 @@ static RPCHelpMan disconnectnode()
                 {
                     {"address", RPCArg::Type::STR, RPCArg::DefaultHint{"fallback to nodeid"}, "The IP address/port of the node"},
                     {"nodeid", RPCArg::Type::NUM, RPCArg::DefaultHint{"fallback to address"}, "The node ID (see getpeerinfo for node IDs)"},
+                    {"wait", RPCArg::Type::BOOL, RPCArg::Default{false}, "Wait until the node has been removed from the list of connected peers before returning. "
+                        "Fails if this takes longer than " + ToString(count_seconds(DISCONNECTNODE_WAIT_TIMEOUT)) + " seconds"},
                 },
                 RPCResult{RPCResult::Type::NONE, "", ""},
                 RPCExamples{
@@ -403,15 +445,16 @@ static RPCHelpMan disconnectnode()
     CConnman& connman = EnsureConnman(node);
 
     bool success;
+    NodeId nodeid{-1};
     const UniValue &address_arg = request.params[0];
     const UniValue &id_arg = request.params[1];
 
     if (!address_arg.isNull() && id_arg.isNull()) {
         /* handle disconnect-by-address */
-        success = connman.DisconnectNode(address_arg.get_str());
+        success = connman.DisconnectNode(address_arg.get_str(), &nodeid);
     } else if (!id_arg.isNull() && (address_arg.isNull() || (address_arg.isStr() && address_arg.get_str().empty()))) {
         /* handle disconnect-by-id */
-        NodeId nodeid = (NodeId) id_arg.get_int64();
+        nodeid = (NodeId) id_arg.get_int64();
         success = connman.DisconnectNode(nodeid);
     } else {
         throw JSONRPCError(RPC_INVALID_PARAMS, "Only one of address and nodeid should be provided.");
@@ -421,11 +464,41 @@ static RPCHelpMan disconnectnode()
         throw JSONRPCError(RPC_CLIENT_NODE_NOT_CONNECTED, "Node not found in connected nodes");
     }
 
+    if (request.params[2].isTrue() && !WaitForNodeDisconnect(connman, nodeid)) {
+        throw JSONRPCError(RPC_MISC_ERROR, "Error: Timed out waiting for the node to be disconnected");
+    }
+
     return NullUniValue;
 },
     };
 }
 
+static RPCHelpMan waitforpeerdisconnect()
+{
+    return RPCHelpMan{"waitforpeerdisconnect",
+                "\nWaits until all peers that are marked for disconnection have been removed from the list of connected peers.\n"
+                "This RPC is for testing only.\n",
+                {
+                    {"timeout", RPCArg::Type::NUM, RPCArg::Default{0}, "Time in milliseconds to wait for a response. 0 indicates no timeout."},
+                },
+                RPCResult{RPCResult::Type::BOOL, "", "false if peers were still being disconnected on timeout or exit"},
+                RPCExamples{
+                    HelpExampleCli("waitforpeerdisconnect", "1000")
+            + HelpExampleRpc("waitforpeerdisconnect", "1000")
+                },
+        [&](const RPCHelpMan& self, const JSONRPCRequest& request) -> UniValue
+{
+    NodeContext& node = EnsureAnyNodeContext(request.context);
+    CConnman& connman = EnsureConnman(node);
+
+    const int timeout{request.params[0].isNull() ? 0 : request.params[0].get_int()};
+    if (timeout < 0) throw JSONRPCError(RPC_INVALID_PARAMETER, "Timeout may not be negative");
+
+    return WaitUntilNoPendingDisconnects(connman, std::chrono::milliseconds{timeout});
+},
+    };
+}
+
 static RPCHelpMan getaddednodeinfo()
 {
     return RPCHelpMan{"getaddednodeinfo",
@@ -822,6 +895,32 @@ static RPCHelpMan clearbanned()
     };
 }
 
+static RPCHelpMan reloadbanlist()
+{
+    return RPCHelpMan{"reloadbanlist",
+                "\nWrite the banlist to disk and read it back, as is done on a node restart. This RPC is for testing only.\n",
+                {},
+                RPCResult{RPCResult::Type::NONE, "", ""},
+                RPCExamples{
+                    HelpExampleCli("reloadbanlist", "")
+                            + HelpExampleRpc("reloadbanlist", "")
+                },
+        [&](const RPCHelpMan& self, const JSONRPCRequest& request) -> UniValue
+{
+    NodeContext& node = EnsureAnyNodeContext(request.context);
+    if (!node.banman) {
+        throw JSONRPCError(RPC_DATABASE_ERROR, "Error: Ban database not loaded");
+    }
+
+    if (!node.banman->ReloadBanlist()) {
+        throw JSONRPCError(RPC_DATABASE_ERROR, "Error: Failed to write or read back the ban database");
+    }
+
+    return NullUniValue;
+},
+    };
+}
+
 static RPCHelpMan setnetworkactive()
 {
     return RPCHelpMan{"setnetworkactive",
@@ -965,6 +1064,8 @@ static const CRPCCommand commands[] =
 
     { "hidden",              &addconnection,           },
     { "hidden",              &addpeeraddress,          },
+    { "hidden",              &reloadbanlist,           },
+    { "hidden",              &waitforpeerdisconnect,   },
 };
 // clang-format on
     for (const auto& c : commands) {
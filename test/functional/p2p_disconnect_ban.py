@@ -3,7 +3,6 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or http://www.opensource.org/licenses/mit-license.php.
 """Test node disconnect and ban behavior"""
-import time
 
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import (
@@ -11,11 +10,26 @@ from test_framework.util import (
     assert_raises_rpc_error,
 )
 
+IPV6_ADDRESS = "2001:4d48:ac57:400:cacf:e9ff:fe1d:9c63"
+
+
+def assert_batch_rpc_error(response, code, message):
+    """Check that a single response of a JSON-RPC batch is the expected error"""
+    assert_equal(response['result'], None)
+    assert_equal(response['error']['code'], code)
+    assert message in response['error']['message'], "Expected substring not found in error message:\nsubstring: '{}'\nerror message: '{}'.".format(message, response['error']['message'])
+
+
 class DisconnectBanTest(BitcoinTestFramework):
     def set_test_params(self):
         self.num_nodes = 2
         self.supports_cli = False
 
+    def _wait_for_disconnect(self, node, expected):
+        """Wait until the socket handler thread has reaped the disconnected peers of node."""
+        assert node.waitforpeerdisconnect(int(10000 * self.options.timeout_factor))
+        assert_equal(len(node.getpeerinfo()), expected)
+
     def run_test(self):
         self.log.info("Connect nodes both way")
         # By default, the test framework sets up an addnode connection from
@@ -24,13 +38,10 @@ class DisconnectBanTest(BitcoinTestFramework):
         # Topology will look like: node0 <--> node1
         self.connect_nodes(0, 1)
 
-        self.log.info("Test setban and listbanned RPCs")
-
         self.log.info("setban: successfully ban single IP address")
         assert_equal(len(self.nodes[1].getpeerinfo()), 2)  # node1 should have 2 connections to node0 at this point
         self.nodes[1].setban(subnet="127.0.0.1", command="add")
-        self.wait_until(lambda: len(self.nodes[1].getpeerinfo()) == 0, timeout=10)
-        assert_equal(len(self.nodes[1].getpeerinfo()), 0)  # all nodes must be disconnected at this point
+        self._wait_for_disconnect(self.nodes[1], 0)  # all nodes must be disconnected at this point
         assert_equal(len(self.nodes[1].listbanned()), 1)
 
         self.log.info("clearbanned: successfully clear ban list")
@@ -42,40 +53,59 @@ class DisconnectBanTest(BitcoinTestFramework):
         assert_equal(len(self.nodes[1].listbanned()), 1)
         assert_raises_rpc_error(-23, "IP/Subnet already banned", self.nodes[1].setban, "127.0.0.1", "add")
 
-        self.log.info("setban: fail to ban an invalid subnet")
-        assert_raises_rpc_error(-30, "Error: Invalid IP/Subnet", self.nodes[1].setban, "127.0.0.1/42", "add")
-        assert_equal(len(self.nodes[1].listbanned()), 1)  # still only one banned ip because 127.0.0.1 is within the range of 127.0.0.0/24
-
-        self.log.info("setban remove: fail to unban a non-banned subnet")
-        assert_raises_rpc_error(-30, "Error: Unban failed", self.nodes[1].setban, "127.0.0.1", "remove")
-        assert_equal(len(self.nodes[1].listbanned()), 1)
+        self.log.info("setban: fail to ban an invalid subnet or to unban a non-banned subnet")
+        # A failing call does not abort the rest of a batch, so both checks can share one request
+        results = self.nodes[1].batch([
+            self.nodes[1].setban.get_request("127.0.0.1/42", "add"),
+            self.nodes[1].listbanned.get_request(),
+            self.nodes[1].setban.get_request("127.0.0.1", "remove"),
+            self.nodes[1].listbanned.get_request(),
+        ])
+        assert_batch_rpc_error(results[0], -30, "Error: Invalid IP/Subnet")
+        assert_equal(len(results[1]['result']), 1)  # still only one banned ip because 127.0.0.1 is within the range of 127.0.0.0/24
+        assert_batch_rpc_error(results[2], -30, "Error: Unban failed")
+        assert_equal(len(results[3]['result']), 1)
 
         self.log.info("setban remove: successfully unban subnet")
         self.nodes[1].setban("127.0.0.0/24", "remove")
         assert_equal(len(self.nodes[1].listbanned()), 0)
-        self.nodes[1].clearbanned()
+
+        self.log.info("clearbanned: clearing an empty ban list succeeds without rewriting banlist.dat")
+        with self.nodes[1].assert_debug_log(expected_msgs=[], unexpected_msgs=["Flushed"]):
+            self.nodes[1].clearbanned()
         assert_equal(len(self.nodes[1].listbanned()), 0)
 
-        self.log.info("setban: test persistence across node restart")
-        self.nodes[1].setban("127.0.0.0/32", "add")
-        self.nodes[1].setban("127.0.0.0/24", "add")
+        self.log.info("setban: test persistence across banlist reload")
         # Set the mocktime so we can control when bans expire
-        old_time = int(time.time())
-        self.nodes[1].setmocktime(old_time)
-        self.nodes[1].setban("192.168.0.1", "add", 1)  # ban for 1 seconds
-        self.nodes[1].setban("2001:4d48:ac57:400:cacf:e9ff:fe1d:9c63/19", "add", 1000)  # ban for 1000 seconds
-        listBeforeShutdown = self.nodes[1].listbanned()
-        assert_equal("192.168.0.1/32", listBeforeShutdown[2]['address'])
+        old_time = 1_600_000_000
+        # The calls of a batch are executed in order, so submit them all in a single request
+        results = self.nodes[1].batch([
+            self.nodes[1].setban.get_request("127.0.0.0/32", "add"),
+            self.nodes[1].setban.get_request("127.0.0.0/24", "add"),
+            self.nodes[1].setmocktime.get_request(old_time),
+            self.nodes[1].setban.get_request("192.168.0.1", "add", 1),  # ban for 1 seconds
+            self.nodes[1].setban.get_request(IPV6_ADDRESS + "/19", "add", 1000),  # ban for 1000 seconds
+            self.nodes[1].listbanned.get_request(),
+        ])
+        for res in results:
+            assert_equal(res['error'], None)
+        listBeforeReload = results[-1]['result']
+        assert_equal("192.168.0.1/32", listBeforeReload[2]['address'])
+        # Relative bans are anchored to the mocktime, so their expiry is exact
+        assert_equal(old_time + 1, listBeforeReload[2]['banned_until'])
+        assert_equal(old_time + 1000, listBeforeReload[3]['banned_until'])
         # Move time forward by 3 seconds so the third ban has expired
         self.nodes[1].setmocktime(old_time + 3)
         assert_equal(len(self.nodes[1].listbanned()), 3)
 
-        self.restart_node(1)
+        # Write the banlist to disk and read it back, as a node restart would
+        self.nodes[1].reloadbanlist()
 
-        listAfterShutdown = self.nodes[1].listbanned()
-        assert_equal("127.0.0.0/24", listAfterShutdown[0]['address'])
-        assert_equal("127.0.0.0/32", listAfterShutdown[1]['address'])
-        assert_equal("/19" in listAfterShutdown[2]['address'], True)
+        listAfterReload = self.nodes[1].listbanned()
+        assert_equal("127.0.0.0/24", listAfterReload[0]['address'])
+        assert_equal("127.0.0.0/32", listAfterReload[1]['address'])
+        assert_equal("/19" in listAfterReload[2]['address'], True)
+        self.nodes[1].setmocktime(0)
 
         # Clear ban lists
         self.nodes[1].clearbanned()
@@ -83,32 +113,35 @@ class DisconnectBanTest(BitcoinTestFramework):
         self.connect_nodes(0, 1)
         self.connect_nodes(1, 0)
 
-        self.log.info("Test disconnectnode RPCs")
-
         self.log.info("disconnectnode: fail to disconnect when calling with address and nodeid")
-        address1 = self.nodes[0].getpeerinfo()[0]['addr']
-        node1 = self.nodes[0].getpeerinfo()[0]['addr']
+        peers = self.nodes[0].getpeerinfo()
+        address1 = peers[0]['addr']
+        node1 = peers[0]['addr']
         assert_raises_rpc_error(-32602, "Only one of address and nodeid should be provided.", self.nodes[0].disconnectnode, address=address1, nodeid=node1)
 
         self.log.info("disconnectnode: fail to disconnect when calling with junk address")
         assert_raises_rpc_error(-29, "Node not found in connected nodes", self.nodes[0].disconnectnode, address="221B Baker Street")
 
         self.log.info("disconnectnode: successfully disconnect node by address")
-        address1 = self.nodes[0].getpeerinfo()[0]['addr']
-        self.nodes[0].disconnectnode(address=address1)
-        self.wait_until(lambda: len(self.nodes[0].getpeerinfo()) == 1, timeout=10)
-        assert not [node for node in self.nodes[0].getpeerinfo() if node['addr'] == address1]
+        # The failed calls above did not change the peers, so address1 can be reused
+        # With wait=True, the call only returns once this peer is no longer connected
+        self.nodes[0].disconnectnode(address=address1, wait=True)
+        peers = self.nodes[0].getpeerinfo()
+        assert_equal(len(peers), 1)
+        assert not any(node['addr'] == address1 for node in peers)
 
         self.log.info("disconnectnode: successfully reconnect node")
         self.connect_nodes(0, 1)  # reconnect the node
-        assert_equal(len(self.nodes[0].getpeerinfo()), 2)
-        assert [node for node in self.nodes[0].getpeerinfo() if node['addr'] == address1]
+        peers = self.nodes[0].getpeerinfo()
+        assert_equal(len(peers), 2)
+        assert any(node['addr'] == address1 for node in peers)
 
         self.log.info("disconnectnode: successfully disconnect node by node id")
-        id1 = self.nodes[0].getpeerinfo()[0]['id']
-        self.nodes[0].disconnectnode(nodeid=id1)
-        self.wait_until(lambda: len(self.nodes[0].getpeerinfo()) == 1, timeout=10)
-        assert not [node for node in self.nodes[0].getpeerinfo() if node['id'] == id1]
+        id1 = peers[0]['id']
+        self.nodes[0].disconnectnode(nodeid=id1, wait=True)
+        peers = self.nodes[0].getpeerinfo()
+        assert_equal(len(peers), 1)
+        assert not any(node['id'] == id1 for node in peers)
 
 if __name__ == '__main__':
     DisconnectBanTest().main()